@@ -6,34 +6,72 @@ Convert image-only (or partly image) PDFs into searchable PDFs and/or text using
 
 Features:
 - Input: single PDF or directory of PDFs (batch)
-- Uses pdf2image to rasterize pages
-- Uses pytesseract (Tesseract) to OCR pages
+- Uses pdf2image to rasterize pages (streamed in small page windows to bound memory)
+- Uses pytesseract (Tesseract) to OCR pages, or tesserocr in-process when installed (--engine)
 - Outputs: searchable PDF and/or .txt
 - Preserves original pages that already contain selectable text (optional)
-- Configurable DPI and language(s)
+- Configurable DPI and language(s); optional grayscale/bilevel/downscaled images for faster OCR
 - Progress bar with tqdm, logging, and error handling
+- Batch directories are processed in parallel across CPU cores (--jobs)
+- Pages within a PDF are OCR'd concurrently (OCR_CONCURRENCY environment variable)
+- Optionally OCRs several pages per Tesseract run to amortize start-up cost (--ocr-batch)
+- Identical page images within a PDF (cover sheets, separators, blank backs) are OCR'd only once
 
-Dependencies (Python): pytesseract, pdf2image, PyPDF2, pdfplumber, Pillow, tqdm
+Dependencies (Python): pytesseract, pdf2image, pikepdf, pdfplumber, Pillow, NumPy, tqdm
+Optional (Python): tesserocr
 System deps: Tesseract OCR (tesseract), Poppler (pdftoppm)
 
 Author: ChatGPT-style assistant
 """
 
+from __future__ import annotations
+
 import os
 import io
 import sys
 import argparse
+import contextlib
+import functools
+import gc
+import hashlib
+import importlib.util
 import logging
+import multiprocessing
+import shlex
+import subprocess
 import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from multiprocessing import cpu_count
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+# The OCR/PDF libraries take a second or two to import, so they are imported inside the functions
+# that use them; argument errors, --help and the GUI window come up without waiting for them.
+if TYPE_CHECKING:
+    import pikepdf
+    from PIL import Image
+    from tqdm import tqdm
+
+def _env_int(name: str, default: int) -> int:
+    """
+    Read a positive integer setting from the environment. An unset variable gives default; an invalid
+    one is ignored with a warning, so a typo cannot break importing the module (--help, the GUI).
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed < 1:
+        # Not logging.warning(): at import time that would configure the root logger before main() does
+        logging.getLogger(__name__).warning(f"Ignoring invalid {name}={value!r}: expected a positive integer, using {default}.")
+        return default
+    return parsed
 
-from tqdm import tqdm
-from pdf2image import convert_from_path #, PDFInfoNotInstalledError
-import pytesseract
-from PyPDF2 import PdfReader, PdfWriter
-import pdfplumber
-from PIL import Image
 
 # -------------------------
 # Configuration defaults
@@ -43,22 +81,48 @@ DEFAULT_LANG = "eng"   # You can specify multiple like "eng+fra"
 DEFAULT_OUTPUT_PDF = True
 DEFAULT_OUTPUT_TXT = False
 DEFAULT_SKIP_OCR_IF_TEXT = True
+BINARIZE_THRESHOLD = 180  # Gray level below which a pixel becomes black with --binarize
+DEFAULT_JOBS = cpu_count()  # Parallel worker processes for batch input (one PDF per process)
+DEFAULT_RASTER_CHUNK = 10  # Pages rasterized per pdf2image call; bounds how many page images are held in RAM
+GC_CHUNK_THRESHOLD = 20  # Run a garbage collection after each raster window larger than this
+DEFAULT_RASTERIZE_THREADS = max(1, cpu_count() // 2)  # pdftoppm processes per window; leaves half the cores for Tesseract
+DEFAULT_OCR_BATCH = 1  # Pages per Tesseract invocation; >1 uses one tesseract run on an image list file
+DEFAULT_PAGE_WORKERS = _env_int("OCR_CONCURRENCY", cpu_count())  # Concurrent Tesseract runs per PDF
+OCR_ENGINES = ("auto", "pytesseract", "tesserocr")
+DEFAULT_OCR_ENGINE = "auto"  # tesserocr if importable, else pytesseract
+PAGE_BREAK = "\n\n=== PAGE BREAK ===\n\n"  # Separator between pages in .txt output
+TXT_BUFFER_SIZE = 1 << 20  # Page texts are streamed to the .txt output through a 1 MiB buffer
+PDF_BUFFER_SIZE = 4 << 20  # qpdf writes the output PDF in many small pieces; batch them into 4 MiB writes
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 
 # -------------------------
 # Helper / utility funcs
 # -------------------------
 
+@functools.lru_cache(maxsize=8)
+def _tesseract_version(tesseract_cmd: str) -> str:
+    """
+    Run `tesseract --version` for the given executable and return the first line of its output.
+    Successful checks are cached per executable, so repeated runs (e.g. GUI clicks) don't spawn
+    it again; failures raise and are therefore not cached.
+    """
+    result = subprocess.run([tesseract_cmd, "--version"], check=True, capture_output=True, text=True)
+    return (result.stdout or result.stderr).splitlines()[0]
+
+
 def check_dependencies(tesseract_cmd: Optional[str] = None):
     """
     Check that Tesseract and pdf2image/poppler are available.
     Raises RuntimeError with helpful message if missing.
     """
-    # Tesseract
+    import pytesseract
+
+    # Tesseract. The path is applied on every call (only the version check is cached), so a
+    # failed check of another path cannot leave pytesseract pointing at it.
+    if tesseract_cmd:
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
     try:
-        if tesseract_cmd:
-            pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
-        _ = pytesseract.get_tesseract_version()
+        _tesseract_version(pytesseract.pytesseract.tesseract_cmd)
     except Exception as e:
         raise RuntimeError(
             "Tesseract not found or not working. Please install Tesseract OCR and ensure it's on PATH, "
@@ -75,48 +139,159 @@ def check_dependencies(tesseract_cmd: Optional[str] = None):
         pass
 
 
-def list_input_files(input_path: Path) -> List[Path]:
+def _scan_pdfs(directory: Path, recursive: bool = False, top: bool = True) -> Iterator[Path]:
     """
-    If input_path is a file, return [file]. If a directory, return list of pdf files (non-recursive).
+    Yield the PDF files in directory (regular files or links to them; dangling links are skipped),
+    and with recursive those of its subdirectories too. Like os.walk, symlinked directories are not
+    followed and unreadable subdirectories are skipped with a warning.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError as e:
+        if top:
+            raise
+        logging.warning(f"Skipping unreadable directory {directory}: {e}")
+        return
+    for entry in entries:
+        if entry.is_file() and entry.name.lower().endswith(".pdf"):
+            yield Path(entry.path)
+        elif recursive and entry.is_dir(follow_symlinks=False):
+            yield from _scan_pdfs(Path(entry.path), recursive, top=False)
+
+
+def list_input_files(input_path: Path, recursive: bool = False) -> List[Path]:
+    """
+    If input_path is a file, return [file]. If a directory, return sorted list of pdf files,
+    descending into subdirectories if recursive.
+    Uses os.scandir, whose directory entries carry the file type, so large folders are listed
+    without a stat() call per entry.
     """
     if input_path.is_file():
         return [input_path]
     elif input_path.is_dir():
-        pdfs = sorted([p for p in input_path.iterdir() if p.suffix.lower() == ".pdf"])
-        return pdfs
+        return sorted(_scan_pdfs(input_path, recursive))
     else:
         raise FileNotFoundError(f"Input path {input_path} does not exist.")
 
 
-def pdf_page_has_text(pdf_path: Path, page_number: int) -> bool:
+@contextlib.contextmanager
+def open_text_layer(pdf_path: Path):
     """
-    Check if a particular page has selectable/existing text (using pdfplumber).
-    Returns True if page text length > 20 (configurable threshold).
+    Open pdf_path once with pdfplumber for text-layer checks and extraction.
+    Yields None if pdfplumber cannot parse the file (every page is then OCR'd).
+    """
+    import pdfplumber
+
+    try:
+        doc = pdfplumber.open(str(pdf_path))
+    except Exception as e:
+        logging.warning(f"pdfplumber could not open {pdf_path.name}: {e}. All pages will be OCR'd.")
+        yield None
+        return
+    with doc:
+        yield doc
+
+
+@contextlib.contextmanager
+def atomic_output(path: Path, mode: str = "wb", **open_kwargs):
+    """
+    Open a temporary file next to path for writing and move it over path when the block completes.
+    If the block raises, the temporary file is removed instead, so a failed or interrupted run never
+    leaves a truncated output behind or replaces an earlier good one.
     """
+    tmp_path = path.with_name(f"{path.name}.part")
     try:
-        with pdfplumber.open(str(pdf_path)) as doc:
+        with open(tmp_path, mode, **open_kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
+def pdf_page_has_text(doc, page_number: int, text_cache: Optional[Dict[int, str]] = None) -> bool:
+    """
+    Check if a particular page of an open pdfplumber document has selectable/existing text.
+    Returns True if page text length > 20 (configurable threshold).
+    If text_cache is given, the extracted text is stored in it by page number (and reused on
+    later calls) so each page is extracted at most once, including for .txt output.
+    """
+    if doc is None:
+        return False
+    if text_cache is not None and page_number in text_cache:
+        text = text_cache[page_number]
+    else:
+        try:
             if page_number < 0 or page_number >= len(doc.pages):
                 return False
-            text = doc.pages[page_number].extract_text()
-            if text and len(text.strip()) > 20:
-                return True
-    except Exception:
-        # If pdfplumber fails, assume no text to be safe and run OCR
-        return False
-    return False
+            text = doc.pages[page_number].extract_text() or ""
+        except Exception:
+            # If pdfplumber fails, assume no text to be safe and run OCR
+            return False
+        if text_cache is not None:
+            text_cache[page_number] = text
+    return len(text.strip()) > 20
 
 
-def pdf_to_images(pdf_path: Path, dpi: int = DEFAULT_DPI, poppler_path: Optional[str] = None):
+def page_windows(page_indices: Sequence[int], chunk: int = DEFAULT_RASTER_CHUNK) -> Iterator[Tuple[int, int]]:
     """
-    Convert PDF pages to PIL Images using pdf2image.convert_from_path.
-    Returns list of PIL Image objects.
+    Group sorted 0-based page indices into contiguous (first, last) runs of at most `chunk` pages,
+    e.g. [0, 1, 2, 5, 6] -> (0, 2), (5, 6).
     """
-    kwargs = {"dpi": dpi}
+    first = last = None
+    for page_idx in page_indices:
+        if first is not None and page_idx == last + 1 and page_idx - first < chunk:
+            last = page_idx
+            continue
+        if first is not None:
+            yield first, last
+        first = last = page_idx
+    if first is not None:
+        yield first, last
+
+
+def iter_pdf_images(
+    pdf_path: Path,
+    page_indices: Sequence[int],
+    dpi: int = DEFAULT_DPI,
+    chunk: int = DEFAULT_RASTER_CHUNK,
+    poppler_path: Optional[str] = None,
+    thread_count: int = DEFAULT_RASTERIZE_THREADS,
+    grayscale: bool = False,
+) -> Iterator[Tuple[int, Image.Image]]:
+    """
+    Convert the given PDF pages (sorted, 0-based) to PIL Images using pdf2image.convert_from_path.
+    Contiguous runs of pages are rasterized `chunk` at a time via first_page/last_page, and pages
+    not listed are never rendered. Yields (page_idx, image) in order, so only the current window
+    of pages is decoded in memory rather than the whole document.
+    Each window is split across `thread_count` parallel pdftoppm processes.
+    Windows larger than GC_CHUNK_THRESHOLD pages are followed by a garbage collection.
+    """
+    kwargs = {"dpi": dpi, "thread_count": max(1, thread_count), "grayscale": grayscale}
     if poppler_path:
         kwargs["poppler_path"] = poppler_path
 
+    for first, last in page_windows(page_indices, chunk):
+        images = _convert_page_range(pdf_path, first + 1, last + 1, **kwargs)
+        if len(images) != last - first + 1:
+            # Sometimes convert_from_path returns same count, but if not, warn.
+            logging.warning(f"pdf2image returned {len(images)} images for pages {first+1}-{last+1} of {pdf_path.name}.")
+        yield from zip(range(first, last + 1), images)
+        del images
+        if chunk > GC_CHUNK_THRESHOLD:
+            gc.collect()
+
+
+def _convert_page_range(pdf_path: Path, first_page: int, last_page: int, **kwargs) -> List[Image.Image]:
+    """
+    Rasterize pages first_page..last_page (1-based, inclusive) with convert_from_path.
+    """
+    from pdf2image import convert_from_path #, PDFInfoNotInstalledError
+
     try:
-        images = convert_from_path(str(pdf_path), **kwargs)
+        return convert_from_path(str(pdf_path), first_page=first_page, last_page=last_page, **kwargs)
     # except PDFInfoNotInstalledError as e:
     #     raise RuntimeError(
     #         "Poppler not found. Install poppler (provides pdftoppm). On Debian/Ubuntu: sudo apt install poppler-utils. "
@@ -125,40 +300,450 @@ def pdf_to_images(pdf_path: Path, dpi: int = DEFAULT_DPI, poppler_path: Optional
     except Exception as e:
         raise RuntimeError(f"Failed to convert PDF to images: {e}") from e
 
-    return images
+
+def prepare_image_for_ocr(image: Image.Image) -> Image.Image:
+    """
+    Ensure image is in a format Tesseract likes (RGB, grayscale or bilevel), flattening transparency onto white.
+    """
+    if image.mode in ("RGBA", "LA"):
+        import numpy as np
+        from PIL import Image
+
+        # Vectorized alpha blend onto white: rgb * a + 255 * (255 - a), scaled back by 255
+        arr = np.asarray(image.convert("RGBA"), dtype=np.uint8)
+        a = arr[..., 3:4].astype(np.uint16)
+        rgb = (arr[..., :3].astype(np.uint16) * a + 255 * (255 - a)) // 255
+        flattened = Image.fromarray(rgb.astype(np.uint8))
+        flattened.info = image.info.copy()
+        return flattened
+    if image.mode in ("RGB", "L", "1"):
+        return image
+    return image.convert("RGB")
+
+
+def preprocess_page_image(
+    image: Image.Image,
+    dpi: int = DEFAULT_DPI,
+    ocr_dpi: Optional[int] = None,
+    grayscale: bool = False,
+    binarize: bool = False,
+) -> Image.Image:
+    """
+    Optionally reduce a rendered page before OCR: grayscale, downscale to ocr_dpi, then threshold
+    to 1-bit. Tesseract binarizes internally, so text-only scans lose nothing but the work shrinks;
+    note the reduced image is also what gets embedded in the searchable PDF.
+    The image is tagged with its effective DPI (info["dpi"]). The tag alone does not reach Tesseract:
+    ocr_one_page passes it as --dpi and ocr_images_batch writes it into the PNGs, so output pages
+    keep their real size after --ocr-dpi.
+    """
+    if grayscale or binarize:
+        image = prepare_image_for_ocr(image).convert("L")
+    if ocr_dpi and ocr_dpi < dpi:
+        from PIL import Image
+
+        w, h = image.size
+        image = image.resize((w * ocr_dpi // dpi, h * ocr_dpi // dpi), Image.Resampling.LANCZOS)
+        dpi = ocr_dpi
+    if binarize:
+        image = image.point(lambda p: 0 if p < BINARIZE_THRESHOLD else 255, mode="1")
+    image.info["dpi"] = (dpi, dpi)
+    return image
 
 
-def ocr_image_to_pdf_bytes(image: Image.Image, lang: str = DEFAULT_LANG, config: Optional[str] = None) -> bytes:
+def ocr_image_to_pdf_bytes(image: Image.Image, lang: str = DEFAULT_LANG, config: str = "") -> bytes:
     """
     Run Tesseract OCR on a PIL Image and return a PDF (bytes) with an invisible text layer (searchable PDF).
     Uses pytesseract.image_to_pdf_or_hocr.
     """
-    # Ensure image is in a format Tesseract likes (RGB)
-    if image.mode in ("RGBA", "LA"):
-        bg = Image.new("RGB", image.size, (255, 255, 255))
-        bg.paste(image, mask=image.split()[-1])
-        image_for_ocr = bg
-    else:
-        image_for_ocr = image.convert("RGB")
+    import pytesseract
 
-    pdf_bytes = pytesseract.image_to_pdf_or_hocr(image_for_ocr, extension="pdf", lang=lang, config=config or "")
+    image_for_ocr = prepare_image_for_ocr(image)
+    pdf_bytes = pytesseract.image_to_pdf_or_hocr(image_for_ocr, extension="pdf", lang=lang, config=config)
     return pdf_bytes
 
 
-def ocr_image_to_text(image: Image.Image, lang: str = DEFAULT_LANG, config: Optional[str] = None) -> str:
+def ocr_image_to_text(image: Image.Image, lang: str = DEFAULT_LANG, config: str = "") -> str:
     """
     Extract plain text from PIL Image using pytesseract.
     """
-    return pytesseract.image_to_string(image, lang=lang, config=config or "")
+    import pytesseract
+
+    return pytesseract.image_to_string(image, lang=lang, config=config)
+
+
+def ocr_one_page(
+    page_idx: int,
+    image: Image.Image,
+    lang: str = DEFAULT_LANG,
+    config: str = "",
+    want_text: bool = False,
+) -> Tuple[int, bytes, Optional[str]]:
+    """
+    OCR a single page image. Returns (page_idx, pdf_bytes, text or None).
+    Safe to run from worker threads: every call drives its own tesseract subprocess.
+    pytesseract saves the image without its DPI tag, so a tagged resolution is passed as --dpi
+    unless the config already sets one.
+    """
+    dpi = image.info.get("dpi")
+    if dpi and "--dpi" not in config:
+        config = f"{config} --dpi {round(dpi[0])}".strip()
+    pdf_bytes = ocr_image_to_pdf_bytes(image, lang=lang, config=config)
+    text = ocr_image_to_text(image, lang=lang, config=config) if want_text else None
+    return page_idx, pdf_bytes, text
+
+
+def resolve_ocr_engine(engine: str = DEFAULT_OCR_ENGINE) -> str:
+    """
+    Map an --engine choice to the backend that will actually run ("pytesseract" or "tesserocr").
+    """
+    # Optional: tesserocr runs Tesseract in-process through its C++ API (no subprocess / model reload per page)
+    tesserocr_installed = importlib.util.find_spec("tesserocr") is not None
+    if engine == "auto":
+        return "tesserocr" if tesserocr_installed else "pytesseract"
+    if engine == "tesserocr" and not tesserocr_installed:
+        raise RuntimeError("tesserocr engine requested but tesserocr is not installed (pip install tesserocr).")
+    if engine not in OCR_ENGINES:
+        raise ValueError(f"Unknown OCR engine: {engine}")
+    return engine
+
+
+def _parse_tesseract_config(config: str) -> dict:
+    """
+    Translate the CLI-style Tesseract options that have API equivalents (--psm N, --oem N, --dpi N,
+    --tessdata-dir DIR, -c name=value) into PyTessBaseAPI settings. Other options are ignored with a warning.
+    """
+    args = shlex.split(config, posix=not sys.platform.startswith("win"))
+    opts = {"variables": {}}
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        value = args[i + 1] if i + 1 < len(args) else None
+        if arg in ("--psm", "--oem", "--tessdata-dir") and value is not None:
+            opts[arg.lstrip("-").replace("-", "_")] = value
+            i += 2
+        elif arg == "--dpi" and value is not None:
+            opts["variables"]["user_defined_dpi"] = value
+            i += 2
+        elif arg == "-c" and value is not None and "=" in value:
+            name, var_value = value.split("=", 1)
+            opts["variables"][name] = var_value
+            i += 2
+        else:
+            logging.warning(f"Ignoring Tesseract option not supported by the tesserocr engine: {arg}")
+            i += 1
+    return opts
+
+
+_tesserocr_local = threading.local()
+
+
+def _get_tesserocr_api(lang: str, config: str):
+    """
+    Return this thread's PyTessBaseAPI for (lang, config), creating it on first use.
+    The API keeps the language model loaded across pages; it is not thread-safe, so each
+    OCR worker thread gets its own instance.
+    """
+    apis = getattr(_tesserocr_local, "apis", None)
+    if apis is None:
+        apis = _tesserocr_local.apis = {}
+    api = apis.get((lang, config))
+    if api is None:
+        import tesserocr
+
+        opts = _parse_tesseract_config(config)
+        kwargs = {"lang": lang}
+        if "tessdata_dir" in opts:
+            kwargs["path"] = opts["tessdata_dir"]
+        if "oem" in opts:
+            kwargs["oem"] = int(opts["oem"])
+        if "psm" in opts:
+            kwargs["psm"] = int(opts["psm"])
+        api = tesserocr.PyTessBaseAPI(**kwargs)
+        for name, value in opts["variables"].items():
+            api.SetVariable(name, value)
+        apis[(lang, config)] = api
+    return api
+
+
+def ocr_images_batch(
+    images: Sequence[Image.Image],
+    lang: str = DEFAULT_LANG,
+    config: str = "",
+    want_text: bool = False,
+    engine: str = "pytesseract",
+) -> Tuple[bytes, Optional[List[str]]]:
+    """
+    OCR several page images in a single Tesseract run and return (multipage pdf_bytes, texts or None).
+    The images are written to a temp dir and listed in images.txt, which Tesseract accepts as input.
+    With the pytesseract engine this is one tesseract process per batch instead of one per page; with
+    tesserocr the batch is processed in-process by this thread's API, with no process start-up at all.
+    When want_text is set, the txt output is produced in the same run and split per page.
+    """
+    with tempfile.TemporaryDirectory(prefix="pdf_ocr_") as tmp:
+        tmp_dir = Path(tmp)
+        list_file = tmp_dir / "images.txt"
+        image_paths = []
+        for i, image in enumerate(images):
+            image_path = tmp_dir / f"page_{i:05d}.png"
+            prepare_image_for_ocr(image).save(image_path, dpi=image.info.get("dpi", (DEFAULT_DPI, DEFAULT_DPI)))
+            image_paths.append(str(image_path))
+        list_file.write_text("\n".join(image_paths) + "\n", encoding="utf-8")
+
+        out_stem = tmp_dir / "out"
+        if engine == "tesserocr":
+            api = _get_tesserocr_api(lang, config)
+            # Output formats are picked by these variables, like the "pdf"/"txt" config files on the CLI
+            api.SetVariable("tessedit_create_pdf", "1")
+            api.SetVariable("tessedit_create_txt", "1" if want_text else "0")
+            if not api.ProcessPages(str(out_stem), str(list_file)):
+                raise RuntimeError("tesserocr failed on page batch.")
+        else:
+            import pytesseract
+
+            cmd = [pytesseract.pytesseract.tesseract_cmd, str(list_file), str(out_stem), "-l", lang]
+            cmd += shlex.split(config, posix=not sys.platform.startswith("win"))
+            cmd += ["pdf", "txt"] if want_text else ["pdf"]
+            try:
+                subprocess.run(cmd, check=True, capture_output=True)
+            except subprocess.CalledProcessError as e:
+                raise RuntimeError(f"Tesseract failed on page batch: {e.stderr.decode(errors='replace').strip()}") from e
+
+        pdf_bytes = out_stem.with_suffix(".pdf").read_bytes()
+        texts = None
+        if want_text:
+            # Tesseract separates pages in txt output with a form feed
+            texts = out_stem.with_suffix(".txt").read_text(encoding="utf-8").split("\f")[:len(images)]
+            texts += [""] * (len(images) - len(texts))
+    return pdf_bytes, texts
+
+
+def ocr_page_batch(
+    first_page_idx: int,
+    images: Sequence[Image.Image],
+    lang: str = DEFAULT_LANG,
+    config: str = "",
+    want_text: bool = False,
+    preprocess: Optional[Callable[[Image.Image], Image.Image]] = None,
+    engine: str = "pytesseract",
+) -> Tuple[int, bytes, List[Optional[str]]]:
+    """
+    OCR a run of consecutive page images starting at first_page_idx.
+    Returns (first_page_idx, pdf_bytes with one page per image, per-page texts).
+    With pytesseract a single image goes through image_to_pdf_or_hocr and larger runs use one
+    tesseract invocation; tesserocr handles any run in-process.
+    preprocess (e.g. a partial of preprocess_page_image) is applied to each image first, in the worker.
+    The images are closed afterwards, so their pixel buffers are freed as soon as the OCR is done.
+    """
+    prepared = list(images)
+    try:
+        if preprocess is not None:
+            prepared = [preprocess(image) for image in images]
+        if len(prepared) == 1 and engine == "pytesseract":
+            _, pdf_bytes, text = ocr_one_page(first_page_idx, prepared[0], lang, config, want_text)
+            return first_page_idx, pdf_bytes, [text]
+        pdf_bytes, texts = ocr_images_batch(prepared, lang=lang, config=config, want_text=want_text, engine=engine)
+        return first_page_idx, pdf_bytes, texts or [None] * len(prepared)
+    finally:
+        for image in (*images, *prepared):
+            image.close()
+
+
+def page_image_key(image: Image.Image) -> bytes:
+    """
+    Content hash of a rendered page (mode, size and raw pixels), used to spot identical pages
+    so they are OCR'd once. blake2b hashes the pixel buffer at memory speed.
+    """
+    digest = hashlib.blake2b(f"{image.mode}{image.size}".encode(), digest_size=16)
+    digest.update(image.tobytes())
+    return digest.digest()
+
+
+def has_page_references(pdf: pikepdf.Pdf) -> bool:
+    """
+    True if anything besides the page tree points at page objects: bookmarks, named destinations,
+    forms, the structure tree, article threads, an open action or page annotations (links, widgets).
+    Replacing a page of such a document would leave those references on the old page object, which
+    qpdf then still writes out (scan image included) while the references lead nowhere.
+    """
+    root = pdf.Root
+    if any(key in root for key in ("/Outlines", "/Dests", "/AcroForm", "/StructTreeRoot", "/Threads", "/OpenAction")):
+        return True
+    if "/Names" in root and "/Dests" in root.Names:
+        return True
+    return any("/Annots" in page.obj for page in pdf.pages)
+
+
+def merge_pdf_bytes_into_writer(
+    writer: pikepdf.Pdf,
+    pdf_bytes: bytes,
+    replace_from: Optional[int] = None,
+    page_offset: Optional[int] = None,
+) -> pikepdf.Pdf:
+    """
+    Open pdf_bytes with pikepdf and append its pages to the given output Pdf, or, if replace_from
+    is given, put them in place of the writer's pages starting at that index.
+    If page_offset is given, only that page of pdf_bytes is merged.
+    Returns the opened source Pdf: qpdf copies page content lazily, so the caller must keep
+    it open until the output has been saved.
+    """
+    import pikepdf
+
+    src = pikepdf.Pdf.open(io.BytesIO(pdf_bytes))
+    pages = list(src.pages) if page_offset is None else [src.pages[page_offset]]
+    if replace_from is None:
+        writer.pages.extend(pages)
+    else:
+        for offset, page in enumerate(pages):
+            writer.pages[replace_from + offset] = page
+    return src
+
+
+class _PageWriter:
+    """
+    Output side of process_single_pdf for one PDF: merges finished pages into the output Pdf in page
+    order (the OCR result, or the original page when it keeps its text layer) and streams page text
+    to the .txt file. Everything it touches is handed over explicitly when it is created.
+    """
+
+    def __init__(
+        self,
+        pdf_path: Path,
+        src_pdf: pikepdf.Pdf,
+        writer: pikepdf.Pdf,
+        in_place: bool,
+        keep_open: Callable[[pikepdf.Pdf], pikepdf.Pdf],
+        txt_file: Optional[TextIO],
+        doc,
+        text_layer: Dict[int, str],
+        keep_original: List[bool],
+        pbar: tqdm,
+        ocr_args: tuple,
+        raster_kwargs: dict,
+    ):
+        self.pdf_path = pdf_path
+        self.src_pdf = src_pdf
+        self.writer = writer
+        self.in_place = in_place
+        # qpdf copies page content lazily, so merged OCR results must stay open until the save
+        self.keep_open = keep_open
+        self.txt_file = txt_file
+        self.doc = doc
+        self.text_layer = text_layer
+        self.keep_original = keep_original
+        self.pbar = pbar
+        # Trailing arguments of ocr_page_batch: (lang, config, want_text, preprocess, engine)
+        self.ocr_args = ocr_args
+        self.raster_kwargs = raster_kwargs
+        self.wrote_text = False
+
+    def write_text(self, text: Optional[str]):
+        """Stream one page's text to the .txt output (in page order), skipping empty pages."""
+        if self.txt_file is None or not text:
+            return
+        if self.wrote_text:
+            self.txt_file.write(PAGE_BREAK)
+        self.txt_file.write(text.strip())
+        self.wrote_text = True
+
+    def merge_ocr(self, page_idx: int, pdf_bytes: bytes, texts: List[Optional[str]], offset: Optional[int] = None):
+        """Merge OCR output for pages starting at page_idx (only page `offset` of it, if given)."""
+        replace_from = page_idx if self.in_place else None
+        self.keep_open(merge_pdf_bytes_into_writer(self.writer, pdf_bytes, replace_from, offset))
+        if offset is not None:
+            texts = texts[offset:offset + 1]
+        for text in texts:
+            self.write_text(text)
+
+    def finish(self, page_idx: int, count: int = 1, future: Optional[Future] = None, offset: Optional[int] = None):
+        """
+        Merge pages page_idx..page_idx+count-1 into the writer (in page order), falling back to the
+        original pages on errors. Only OCR batches span more than one page. For a page that duplicates
+        an earlier one, future is that page's OCR job and offset its position within the job.
+        """
+        try:
+            # Pages without an OCR job (existing text layer, or no image rasterized) keep the original page
+            if future is None:
+                if self.keep_original[page_idx]:
+                    logging.info(f"Page {page_idx+1}: contains existing text — copying original page (skip OCR).")
+                else:
+                    logging.warning(f"Page {page_idx+1}: no image was rasterized — copying original page.")
+                # Add original page from original PDF (already in place when editing the original)
+                try:
+                    if not self.in_place:
+                        self.writer.pages.append(self.src_pdf.pages[page_idx])
+                    # Reuse the text pdfplumber extracted during the check for txt output
+                    if self.txt_file is not None:
+                        pdf_page_has_text(self.doc, page_idx, self.text_layer)  # no-op if already extracted
+                        self.write_text(self.text_layer.get(page_idx))
+                except Exception as e:
+                    logging.warning(f"Failed to copy original page {page_idx+1}: {e}. Falling back to OCR.")
+                    # Fall through to OCR if copying fails; the page was not rasterized yet
+                    img = _convert_page_range(self.pdf_path, page_idx + 1, page_idx + 1, **self.raster_kwargs)[0]
+                    _, pdf_bytes, texts = ocr_page_batch(page_idx, [img], *self.ocr_args)
+                    self.merge_ocr(page_idx, pdf_bytes, texts)
+            else:
+                # Collect the OCR result for the rasterized image(s)
+                _, pdf_bytes, texts = future.result()
+                self.merge_ocr(page_idx, pdf_bytes, texts, offset)
+        except Exception as e:
+            logging.exception(f"Error processing page(s) {page_idx+1}-{page_idx+count} of {self.pdf_path.name}: {e}")
+            # To keep page count, add the original pages if possible; otherwise create blank pages.
+            # When editing in place, the original pages are simply left where they are.
+            if not self.in_place:
+                for failed_idx in range(page_idx, page_idx + count):
+                    try:
+                        self.writer.pages.append(self.src_pdf.pages[failed_idx])
+                    except Exception:
+                        # Create a blank white page as fallback
+                        self.writer.add_blank_page(page_size=(595, 842))  # A4-ish fallback
+        self.pbar.update(count)
+
+
+class _PageQueue:
+    """
+    Pages in flight, in page order. Once more than max_pending pages are queued the oldest entries
+    are finished, which bounds how many page images and OCR results are held at once.
+    """
+
+    def __init__(self, finish: Callable[..., None], max_pending: int):
+        self.finish = finish
+        self.max_pending = max_pending
+        self.entries = deque()
+        self.pages = 0
+
+    def put(self, page_idx: int, count: int = 1, future: Optional[Future] = None, offset: Optional[int] = None):
+        self.entries.append((page_idx, count, future, offset))
+        self.pages += count
+        while self.pages > self.max_pending:
+            self._finish_oldest()
+
+    def drain(self):
+        while self.entries:
+            self._finish_oldest()
+
+    def _finish_oldest(self):
+        entry = self.entries.popleft()
+        self.pages -= entry[1]
+        self.finish(*entry)
 
 
-def merge_pdf_bytes_into_writer(writer: PdfWriter, pdf_bytes: bytes):
+def _submit_ocr_batch(
+    executor: ThreadPoolExecutor,
+    batch: List[Tuple[int, Image.Image]],
+    ocr_args: tuple,
+    queue: _PageQueue,
+    page_jobs: Dict[int, Tuple[Future, int]],
+):
     """
-    Read pdf_bytes with PdfReader and append pages to the given PdfWriter.
+    Submit a run of consecutive (page_idx, image) pairs as one OCR job, queue it, record each page's
+    (job, position) in page_jobs for duplicate pages, and empty the batch.
     """
-    reader = PdfReader(io.BytesIO(pdf_bytes))
-    for p in reader.pages:
-        writer.add_page(p)
+    first_idx = batch[0][0]
+    future = executor.submit(ocr_page_batch, first_idx, [img for _, img in batch], *ocr_args)
+    for offset, (page_idx, _) in enumerate(batch):
+        page_jobs[page_idx] = (future, offset)
+    queue.put(first_idx, len(batch), future)
+    batch.clear()
 
 
 def process_single_pdf(
@@ -171,11 +756,29 @@ def process_single_pdf(
     poppler_path: Optional[str] = None,
     tesseract_config: Optional[str] = None,
     out_dir: Optional[Path] = None,
+    show_progress: bool = True,
+    page_workers: int = DEFAULT_PAGE_WORKERS,
+    rasterize_threads: Optional[int] = None,
+    raster_chunk: int = DEFAULT_RASTER_CHUNK,
+    ocr_batch_size: int = DEFAULT_OCR_BATCH,
+    ocr_dpi: Optional[int] = None,
+    grayscale: bool = False,
+    binarize: bool = False,
+    ocr_engine: str = DEFAULT_OCR_ENGINE,
 ):
     """
     Process a single PDF file: convert pages to images, OCR them, and produce outputs.
     Returns a dict summarizing results.
     """
+    import pikepdf
+    from tqdm import tqdm
+
+    ocr_engine = resolve_ocr_engine(ocr_engine)
+    # Normalized once here; the per-page OCR helpers take the config string as-is
+    tesseract_config = (tesseract_config or "").strip()
+    rasterize_threads = rasterize_threads or DEFAULT_RASTERIZE_THREADS
+    raster_chunk = max(1, raster_chunk)
+    ocr_batch_size = max(1, ocr_batch_size)
     out_dir = out_dir or pdf_path.parent
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -183,83 +786,107 @@ def process_single_pdf(
     output_pdf_path = out_dir / f"{base_name}_searchable.pdf" if output_pdf else None
     output_txt_path = out_dir / f"{base_name}.txt" if output_txt else None
 
-    logging.info(f"Processing {pdf_path} (dpi={dpi}, lang={lang})")
+    logging.info(f"Processing {pdf_path} (dpi={dpi}, lang={lang}, engine={ocr_engine})")
 
-    # Try quick check for the number of pages using PyPDF2 to pre-validate PDF
+    # Open the original with pikepdf (qpdf) to pre-validate the PDF, count pages and copy text-layer pages
     try:
-        reader_orig = PdfReader(str(pdf_path))
-        num_pages = len(reader_orig.pages)
+        src_pdf = pikepdf.Pdf.open(pdf_path)
+        num_pages = len(src_pdf.pages)
     except Exception as e:
-        raise RuntimeError(f"Failed to read PDF file with PyPDF2: {e}") from e
+        raise RuntimeError(f"Failed to read PDF file with pikepdf: {e}") from e
 
-    # Convert pages to images (may raise error if poppler missing)
-    images = pdf_to_images(pdf_path, dpi=dpi, poppler_path=poppler_path)
-    if len(images) != num_pages:
-        # Sometimes convert_from_path returns same count, but if not, warn.
-        logging.warning(f"pdf2image returned {len(images)} images but PDF has {num_pages} pages.")
+    # Rendering straight to grayscale (pdftoppm -gray) is cheaper than converting RGB afterwards
+    raster_kwargs = {"dpi": dpi, "poppler_path": poppler_path, "grayscale": grayscale or binarize}
+    preprocess = functools.partial(preprocess_page_image, dpi=dpi, ocr_dpi=ocr_dpi, grayscale=grayscale, binarize=binarize)
+    ocr_args = (lang, tesseract_config, output_txt, preprocess, ocr_engine)
 
-    writer = PdfWriter()
-    all_text = []
+    # With skip_if_text most pages usually keep their text layer, so the original document is edited
+    # in place (and saved under the new name) with only the OCR'd pages swapped in, instead of copying
+    # every page into a fresh document. Documents whose pages are referenced from elsewhere (bookmarks,
+    # links, forms) are still copied, since swapping a page would leave those references dangling.
+    in_place = skip_if_text and not has_page_references(src_pdf)
+    writer = src_pdf if in_place else pikepdf.Pdf.new()
 
-    # Iterate pages with progress bar
-    for page_idx, img in enumerate(tqdm(images, desc=f"OCR pages ({pdf_path.name})", unit="page")):
-        try:
-            # If skip_if_text enabled and page contains text, copy original page
-            if skip_if_text and pdf_page_has_text(pdf_path, page_idx):
-                logging.info(f"Page {page_idx+1}: contains existing text — copying original page (skip OCR).")
-                # Add original page from original PDF
-                try:
-                    writer.add_page(reader_orig.pages[page_idx])
-                    # Also extract text via pdfplumber for txt output if requested
-                    if output_txt:
-                        with pdfplumber.open(str(pdf_path)) as doc:
-                            text = doc.pages[page_idx].extract_text() or ""
-                            all_text.append(text)
-                except Exception as e:
-                    logging.warning(f"Failed to copy original page {page_idx+1}: {e}. Falling back to OCR.")
-                    # Fall through to OCR if copying fails
-                    pdf_bytes = ocr_image_to_pdf_bytes(img, lang=lang, config=tesseract_config)
-                    merge_pdf_bytes_into_writer(writer, pdf_bytes)
-                    if output_txt:
-                        text = ocr_image_to_text(img, lang=lang, config=tesseract_config)
-                        all_text.append(text)
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(src_pdf)
+        if not in_place:
+            stack.enter_context(writer)
+        # pdfplumber parses the PDF once here instead of once per page
+        doc = stack.enter_context(open_text_layer(pdf_path)) if skip_if_text else None
+        # Page text goes straight to the .txt file instead of being accumulated in memory; it only
+        # replaces the real .txt once the whole PDF has been processed.
+        txt_file = (
+            stack.enter_context(atomic_output(output_txt_path, "w", encoding="utf-8", buffering=TXT_BUFFER_SIZE))
+            if output_txt_path else None
+        )
+        pbar = stack.enter_context(
+            tqdm(total=num_pages, desc=f"OCR pages ({pdf_path.name})", unit="page", disable=not show_progress)
+        )
+        # Tesseract runs out of process (the GIL is released while waiting on it), so a thread pool
+        # OCRs pages in parallel. Merging stays serial and in page order: pikepdf objects are not thread-safe.
+        executor = stack.enter_context(ThreadPoolExecutor(max_workers=max(1, page_workers)))
+
+        # Decide up front which pages keep their existing text layer; only the others are rasterized.
+        # The extracted text is cached and reused for the .txt output.
+        text_layer: Dict[int, str] = {}
+        if not skip_if_text:
+            keep_original = [False] * num_pages
+        else:
+            keep_original = [pdf_page_has_text(doc, page_idx, text_layer) for page_idx in range(num_pages)]
+        pages_needing_ocr = [page_idx for page_idx in range(num_pages) if not keep_original[page_idx]]
+
+        pages = _PageWriter(
+            pdf_path, src_pdf, writer, in_place, stack.enter_context, txt_file, doc, text_layer,
+            keep_original, pbar, ocr_args, raster_kwargs,
+        )
+        # Pages are rasterized lazily (may raise error if poppler missing) and submitted as they arrive,
+        # grouped into runs of up to `ocr_batch_size` consecutive pages per OCR job. At most max_pending
+        # pages are in flight, so page images are released soon after they are merged.
+        queue = _PageQueue(pages.finish, max_pending=max(raster_chunk, 2 * page_workers * ocr_batch_size))
+        batch: List[Tuple[int, Image.Image]] = []
+        next_page = 0
+        # Pages with identical images are OCR'd once: image hash -> first page with that image,
+        # and page -> (OCR job, position within the job) once its batch is submitted
+        seen_images: Dict[bytes, int] = {}
+        page_jobs: Dict[int, Tuple[Future, int]] = {}
+
+        for page_idx, img in iter_pdf_images(
+            pdf_path, pages_needing_ocr, chunk=raster_chunk, thread_count=rasterize_threads, **raster_kwargs
+        ):
+            same_as = seen_images.setdefault(page_image_key(img), page_idx)
+            # A batch only holds consecutive pages, so merged output stays in page order. A duplicate
+            # page also ends the batch, which guarantees the page it copies has been submitted.
+            if batch and (same_as != page_idx or page_idx != next_page or len(batch) >= ocr_batch_size):
+                _submit_ocr_batch(executor, batch, ocr_args, queue, page_jobs)
+            # Text-layer pages before this one need no image
+            for skipped_idx in range(next_page, page_idx):
+                queue.put(skipped_idx)
+            if same_as != page_idx:
+                logging.info(f"Page {page_idx+1}: identical to page {same_as+1} — reusing its OCR result.")
+                img.close()
+                queue.put(page_idx, 1, *page_jobs[same_as])
             else:
-                # Perform OCR on the rasterized image
-                pdf_bytes = ocr_image_to_pdf_bytes(img, lang=lang, config=tesseract_config)
-                merge_pdf_bytes_into_writer(writer, pdf_bytes)
-                if output_txt:
-                    text = ocr_image_to_text(img, lang=lang, config=tesseract_config)
-                    all_text.append(text)
-        except Exception as e:
-            logging.exception(f"Error processing page {page_idx+1} of {pdf_path.name}: {e}")
-            # To keep page count, add the original page if possible; otherwise create a blank page
+                batch.append((page_idx, img))
+            next_page = page_idx + 1
+
+        if batch:
+            _submit_ocr_batch(executor, batch, ocr_args, queue, page_jobs)
+        for skipped_idx in range(next_page, num_pages):
+            queue.put(skipped_idx)
+        queue.drain()
+
+        # Write the merged searchable PDF if requested
+        if output_pdf and output_pdf_path:
             try:
-                writer.add_page(reader_orig.pages[page_idx])
-            except Exception:
-                # Create a blank white page as fallback
-                from PyPDF2.generic import RectangleObject
-                writer.add_blank_page(width=595, height=842)  # A4-ish fallback
-
-    # Write the merged searchable PDF if requested
-    if output_pdf and output_pdf_path:
-        try:
-            with open(output_pdf_path, "wb") as f:
-                writer.write(f)
-            logging.info(f"Wrote searchable PDF: {output_pdf_path}")
-        except Exception as e:
-            logging.exception(f"Failed to write output PDF {output_pdf_path}: {e}")
-            raise
+                with atomic_output(output_pdf_path, "wb", buffering=PDF_BUFFER_SIZE) as pdf_file:
+                    writer.save(pdf_file)
+                logging.info(f"Wrote searchable PDF: {output_pdf_path}")
+            except Exception as e:
+                logging.exception(f"Failed to write output PDF {output_pdf_path}: {e}")
+                raise
 
-    # Write text file if requested
     if output_txt and output_txt_path:
-        try:
-            combined_text = "\n\n=== PAGE BREAK ===\n\n".join([t.strip() for t in all_text if t])
-            with open(output_txt_path, "w", encoding="utf-8") as f:
-                f.write(combined_text)
-            logging.info(f"Wrote text output: {output_txt_path}")
-        except Exception as e:
-            logging.exception(f"Failed to write text file {output_txt_path}: {e}")
-            raise
+        logging.info(f"Wrote text output: {output_txt_path}")
 
     return {
         "input": str(pdf_path),
@@ -269,6 +896,91 @@ def process_single_pdf(
     }
 
 
+def configure_parallel_tesseract(concurrent_runs: int, tesseract_config: Optional[str] = None) -> str:
+    """
+    Prepare Tesseract for `concurrent_runs` OCR jobs at once and return the config string to use.
+    Each Tesseract run otherwise starts an OpenMP thread per core, so N parallel runs mean N x cores
+    threads thrashing the caches. With more than one run in flight, each is limited to a single thread
+    (OMP_THREAD_LIMIT=1, inherited by tesseract subprocesses and pool workers) and the LSTM engine is
+    selected (--oem 1) unless the config already picks one. An OMP_THREAD_LIMIT set by the user wins.
+    Trade-off: one PDF on a machine with few cores may OCR a little slower; batch throughput goes up.
+    """
+    tesseract_config = (tesseract_config or "").strip()
+    if concurrent_runs <= 1:
+        return tesseract_config
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    if "--oem" not in tesseract_config:
+        tesseract_config = f"{tesseract_config} --oem 1".strip()
+    return tesseract_config
+
+
+def _init_worker(log_file: Optional[str] = None, tesseract_cmd: Optional[str] = None):
+    """
+    Pool initializer. Re-applies logging and the Tesseract path in worker processes, which
+    start with fresh module state on platforms that spawn rather than fork (Windows, macOS).
+    """
+    if log_file:
+        logging.basicConfig(level=logging.INFO, filename=log_file, filemode="a", format=LOG_FORMAT)
+    else:
+        logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    if tesseract_cmd:
+        import pytesseract
+
+        pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
+
+
+def process_pdf_safe(pdf_path: Path, input_root: Optional[Path] = None, **kwargs) -> dict:
+    """
+    Run process_single_pdf and turn any exception into an error summary dict,
+    so one bad file does not abort a (parallel) batch.
+    With input_root and an out_dir (recursive batches), outputs mirror the file's subfolder
+    under out_dir so same-named PDFs from different folders don't overwrite each other.
+    """
+    if input_root is not None and kwargs.get("out_dir"):
+        kwargs["out_dir"] = kwargs["out_dir"] / pdf_path.parent.relative_to(input_root)
+    try:
+        return process_single_pdf(pdf_path, **kwargs)
+    except Exception as e:
+        logging.exception(f"Failed processing {pdf_path}: {e}")
+        return {"input": str(pdf_path), "error": str(e)}
+
+
+def process_files(
+    files: List[Path],
+    jobs: int = DEFAULT_JOBS,
+    log_file: Optional[str] = None,
+    tesseract_cmd: Optional[str] = None,
+    mp_context: Optional[str] = None,
+    **kwargs,
+) -> Iterator[dict]:
+    """
+    Process several PDFs, yielding one result dict per file as it completes.
+    With jobs > 1 files are distributed over a multiprocessing.Pool (completion order,
+    not input order); kwargs are forwarded to process_single_pdf.
+    mp_context picks the pool's start method (default: the platform's). Multi-threaded callers
+    such as the GUI should pass "spawn", since forking a process with running threads can deadlock.
+    """
+    jobs = max(1, min(jobs, len(files)))
+    # Per-page progress bars from several processes would interleave on the terminal
+    kwargs.setdefault("show_progress", jobs == 1)
+    # Split the page-level thread budget between processes so cores are not oversubscribed
+    kwargs.setdefault("page_workers", max(1, DEFAULT_PAGE_WORKERS // jobs))
+    # Parallelism lives at the page/file level, so each Tesseract run should stay single-threaded
+    kwargs["tesseract_config"] = configure_parallel_tesseract(jobs * kwargs["page_workers"], kwargs.get("tesseract_config"))
+    if not kwargs.get("rasterize_threads"):
+        kwargs["rasterize_threads"] = max(1, DEFAULT_RASTERIZE_THREADS // jobs)
+    worker = functools.partial(process_pdf_safe, **kwargs)
+
+    if jobs == 1:
+        for pdf_file in files:
+            yield worker(pdf_file)
+        return
+
+    ctx = multiprocessing.get_context(mp_context)
+    with ctx.Pool(processes=jobs, initializer=_init_worker, initargs=(log_file, tesseract_cmd)) as pool:
+        yield from pool.imap_unordered(worker, files)
+
+
 # -------------------------
 # CLI entrypoint
 # -------------------------
@@ -278,15 +990,24 @@ def main(argv=None):
     parser.add_argument("input", help="PDF file or directory containing PDFs")
     parser.add_argument("--out-dir", "-o", help="Output directory (default: same folder as input files)", default=None)
     parser.add_argument("--dpi", type=int, default=DEFAULT_DPI, help=f"DPI for rasterizing PDF (default: {DEFAULT_DPI})")
+    parser.add_argument("--ocr-dpi", type=int, default=None, help="Downscale rendered pages to this DPI before OCR (default: same as --dpi)")
+    parser.add_argument("--grayscale", action="store_true", help="Render and OCR pages in grayscale (smaller, faster; output pages lose color)")
+    parser.add_argument("--binarize", action="store_true", help="Threshold pages to black and white before OCR (best for clean text scans)")
     parser.add_argument("--lang", type=str, default=DEFAULT_LANG, help='Tesseract language(s) e.g. "eng" or "eng+fra" (default: eng)')
     parser.add_argument("--txt", action="store_true", help="Also output a .txt file with extracted text")
     parser.add_argument("--no-pdf", action="store_true", help="Do not output searchable PDF (only useful with --txt)")
     parser.add_argument("--skip-text-pages", action="store_true", help="Skip OCR on pages that already contain selectable text (copy original page)")
     parser.add_argument("--poppler-path", type=str, default=None, help="Path to poppler binaries (windows).")
     parser.add_argument("--tesseract-cmd", type=str, default=None, help="Full path to tesseract executable (if not on PATH).")
+    parser.add_argument("--engine", choices=OCR_ENGINES, default=DEFAULT_OCR_ENGINE, help="OCR backend: tesserocr runs Tesseract in-process; auto uses it when installed (default: auto)")
     parser.add_argument("--config", type=str, default=None, help="Extra Tesseract config string (e.g. --psm 1)")
     parser.add_argument("--log", type=str, default=None, help="Log to this file (default: stdout)")
     parser.add_argument("--batch", action="store_true", help="Treat input as directory and process all .pdf files in it")
+    parser.add_argument("--rasterize-threads", type=int, default=None, help=f"Parallel pdftoppm processes used to rasterize pages (default: half the CPU count, {DEFAULT_RASTERIZE_THREADS})")
+    parser.add_argument("--raster-chunk", type=int, default=DEFAULT_RASTER_CHUNK, help=f"Pages rasterized per pdftoppm call; larger windows rasterize faster but hold more page images in RAM (default: {DEFAULT_RASTER_CHUNK})")
+    parser.add_argument("--ocr-batch", type=int, default=DEFAULT_OCR_BATCH, help=f"Pages OCR'd per Tesseract run; larger batches amortize start-up at low DPI (default: {DEFAULT_OCR_BATCH})")
+    parser.add_argument("--recursive", "-r", action="store_true", help="With a directory input, also process PDFs in subdirectories")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help=f"Number of PDFs to process in parallel (default: CPU count, {DEFAULT_JOBS})")
     args = parser.parse_args(argv)
 
     # Setup logging
@@ -297,6 +1018,8 @@ def main(argv=None):
 
     try:
         check_dependencies(args.tesseract_cmd)
+        # Resolved once here so a missing tesserocr fails fast instead of once per file
+        ocr_engine = resolve_ocr_engine(args.engine)
     except RuntimeError as e:
         logging.error(e)
         sys.exit(1)
@@ -306,7 +1029,7 @@ def main(argv=None):
 
     # Build file list
     try:
-        files = list_input_files(input_path)
+        files = list_input_files(input_path, recursive=args.recursive)
     except Exception as e:
         logging.error(f"Input error: {e}")
         sys.exit(1)
@@ -315,24 +1038,34 @@ def main(argv=None):
         logging.error("--batch requires input to be a directory")
         sys.exit(1)
 
+    from tqdm import tqdm
+
     results = []
-    for pdf_file in files:
-        try:
-            res = process_single_pdf(
-                pdf_file,
-                output_pdf=(not args.no_pdf),
-                output_txt=args.txt,
-                dpi=args.dpi,
-                lang=args.lang,
-                skip_if_text=args.skip_text_pages,
-                poppler_path=args.poppler_path,
-                tesseract_config=args.config,
-                out_dir=out_dir
-            )
+    with tqdm(total=len(files), desc="Files", unit="file") as pbar:
+        for res in process_files(
+            files,
+            jobs=args.jobs,
+            log_file=args.log,
+            tesseract_cmd=args.tesseract_cmd,
+            output_pdf=(not args.no_pdf),
+            output_txt=args.txt,
+            dpi=args.dpi,
+            lang=args.lang,
+            skip_if_text=args.skip_text_pages,
+            poppler_path=args.poppler_path,
+            tesseract_config=args.config,
+            rasterize_threads=args.rasterize_threads,
+            raster_chunk=args.raster_chunk,
+            ocr_batch_size=args.ocr_batch,
+            ocr_dpi=args.ocr_dpi,
+            grayscale=args.grayscale,
+            binarize=args.binarize,
+            ocr_engine=ocr_engine,
+            input_root=input_path if args.recursive and input_path.is_dir() else None,
+            out_dir=out_dir
+        ):
             results.append(res)
-        except Exception as e:
-            logging.exception(f"Failed processing {pdf_file}: {e}")
-            results.append({"input": str(pdf_file), "error": str(e)})
+            pbar.update(1)
 
     # Print summary
     print("\nProcessing summary:")
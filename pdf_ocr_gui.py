@@ -4,14 +4,14 @@ import threading
 import queue
 import os
 from pathlib import Path
-from plyer import notification
 
 from pdf_ocr_cli import (
-    process_single_pdf,
+    process_files,
     check_dependencies,
     list_input_files,
     DEFAULT_DPI,
     DEFAULT_LANG,
+    DEFAULT_JOBS,
 )
 
 import logging
@@ -33,6 +33,7 @@ class PDFOCRGUI:
         self.poppler_path = tk.StringVar()
         self.dpi = tk.IntVar(value=DEFAULT_DPI)
         self.lang = tk.StringVar(value=DEFAULT_LANG)
+        self.jobs = tk.IntVar(value=DEFAULT_JOBS)
         self.batch_mode = tk.BooleanVar(value=False)
         self.output_txt = tk.BooleanVar(value=False)
         self.skip_text = tk.BooleanVar(value=True)
@@ -44,8 +45,8 @@ class PDFOCRGUI:
         # Build UI
         self.create_widgets()
 
-        # Poll log queue periodically
-        self.root.after(100, self.process_log_queue)
+        # Drain the log queue when a worker signals new messages
+        self.root.bind("<<LogUpdate>>", self._drain_log_queue)
 
     def create_widgets(self):
         # Input selection frame
@@ -91,6 +92,10 @@ class PDFOCRGUI:
         ttk.Entry(frm_config, textvariable=self.poppler_path, width=60).grid(row=3, column=1, padx=5)
         ttk.Button(frm_config, text="Browse", command=self.browse_poppler).grid(row=3, column=2)
 
+        ttk.Label(frm_config, text="Parallel Jobs:").grid(row=4, column=0, sticky="w")
+        ttk.Spinbox(frm_config, from_=1, to=os.cpu_count() or 1, textvariable=self.jobs, width=8).grid(row=4, column=1, sticky="w")
+        ttk.Label(frm_config, text="(PDFs processed at once in batch mode)").grid(row=4, column=2, sticky="w")
+
         # Logging options
         frm_log = ttk.LabelFrame(self.root, text="Logging", padding=10)
         frm_log.pack(fill="x", padx=10, pady=5)
@@ -146,15 +151,15 @@ class PDFOCRGUI:
     # Logging utility
     def gui_log(self, msg):
         self.log_queue.put(msg)
+        self.root.event_generate("<<LogUpdate>>", when="tail")
 
-    def process_log_queue(self):
+    def _drain_log_queue(self, event=None):
         while not self.log_queue.empty():
             msg = self.log_queue.get_nowait()
             self.console.configure(state="normal")
             self.console.insert(tk.END, msg + "\n")
             self.console.configure(state="disabled")
             self.console.see(tk.END)
-        self.root.after(100, self.process_log_queue)
 
     def start_ocr_thread(self):
         thread = threading.Thread(target=self.run_ocr, daemon=True)
@@ -187,32 +192,38 @@ class PDFOCRGUI:
 
         files = list_input_files(input_path)
         total_files = len(files)
-        self.progress["maximum"] = total_files
-        self.progress["value"] = 0
+        # Widgets are only touched from the Tk thread
+        self.root.after(0, lambda: self.progress.configure(maximum=total_files, value=0))
 
         self.gui_log(f"Processing {total_files} file(s)...")
 
-        for i, f in enumerate(files, start=1):
-            try:
-                res = process_single_pdf(
-                    f,
-                    output_pdf=True,
-                    output_txt=self.output_txt.get(),
-                    dpi=self.dpi.get(),
-                    lang=self.lang.get(),
-                    skip_if_text=self.skip_text.get(),
-                    poppler_path=poppler_path,
-                    tesseract_config=None,
-                    out_dir=out_dir
-                )
+        results = process_files(
+            files,
+            jobs=self.jobs.get(),
+            log_file=log_file,
+            tesseract_cmd=tesseract_cmd,
+            # Tk runs threads of its own, so pool workers are spawned rather than forked
+            mp_context="spawn",
+            output_pdf=True,
+            output_txt=self.output_txt.get(),
+            dpi=self.dpi.get(),
+            lang=self.lang.get(),
+            skip_if_text=self.skip_text.get(),
+            poppler_path=poppler_path,
+            tesseract_config=None,
+            out_dir=out_dir
+        )
+        for i, res in enumerate(results, start=1):
+            if "error" in res:
+                self.gui_log(f"❌ Failed: {res['input']} ({res['error']})")
+            else:
                 self.gui_log(f"✅ Done: {res['input']}")
-            except Exception as e:
-                self.gui_log(f"❌ Failed: {f} ({e})")
 
-            self.progress["value"] = i
-            self.root.update_idletasks()
+            self.root.after(0, lambda v=i: self.progress.configure(value=v))
+
+        # Notify user (plyer is slow to import, so it is loaded only when needed)
+        from plyer import notification
 
-        # Notify user
         notification.notify(
             title="PDF OCR Converter",
             message=f"OCR processing complete! {total_files} file(s) processed.",